@@ -215,10 +215,64 @@ def extract_frames_simple(video_path, num_frames=3):
     
     return frame_paths
 
-def encode_image_to_base64(image_path):
-    """Convert image to base64 for API submission."""
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+# Raw bytes read per base64 step; a multiple of 3 so chunks encode without padding
+FRAME_READ_SIZE = 48 * 1024
+# Target size of each chunk handed to requests for the chunked upload
+BODY_CHUNK_SIZE = 64 * 1024
+
+class FrameDataURL:
+    """Placeholder for a frame's data: URL, base64-encoded only while the body is streamed."""
+    def __init__(self, image_path, mime_type="image/jpeg"):
+        self.image_path = image_path
+        self.mime_type = mime_type
+
+    def iter_encoded(self):
+        """Yield the data: URL as a JSON string, encoding the frame a chunk at a time."""
+        yield f'"data:{self.mime_type};base64,'
+        with open(self.image_path, "rb") as image_file:
+            while True:
+                chunk = image_file.read(FRAME_READ_SIZE)
+                if not chunk:
+                    break
+                # Base64 output only uses JSON-safe characters, so no escaping is needed
+                yield base64.b64encode(chunk).decode('ascii')
+        yield '"'
+
+def iter_json(value):
+    """Serialize value to JSON piece by piece, streaming any FrameDataURL it contains."""
+    if isinstance(value, FrameDataURL):
+        yield from value.iter_encoded()
+    elif isinstance(value, dict):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                yield ", "
+            yield json.dumps(str(key)) + ": "
+            yield from iter_json(item)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from iter_json(item)
+        yield "]"
+    else:
+        yield json.dumps(value, allow_nan=False)
+
+def stream_json_body(data, chunk_size=BODY_CHUNK_SIZE):
+    """Yield the JSON request body as bytes chunks of roughly chunk_size for a chunked upload."""
+    buffer = []
+    buffered = 0
+    for piece in iter_json(data):
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode('utf-8')
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer).encode('utf-8')
 
 def extract_subtitles(video_path):
     """Extract subtitles or generate transcript from video audio."""
@@ -489,9 +543,6 @@ def analyze_video_with_perplexity(video_path, video_info_file=None):
         transcript = "No transcript available."
         print("❌ No transcript available", file=sys.stderr)
     
-    # Convert frames to base64
-    base64_images = [encode_image_to_base64(frame) for frame in frame_paths]
-    
     # Prepare a rich context for Perplexity
     teams_str = f"Teams: {', '.join(teams)}" if teams else ""
     
@@ -535,12 +586,13 @@ IMPORTANT: Do not include any internal thinking or drafting process. Provide onl
         }
     ]
     
-    # Add the images to the user message content
-    for image in base64_images:
+    # Add the images to the user message content; frames are base64-encoded
+    # only while the request body is streamed, so no full copy is held in memory
+    for frame in frame_paths:
         messages[1]["content"].append({
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/jpeg;base64,{image}"
+                "url": FrameDataURL(frame)
             }
         })
     
@@ -561,7 +613,8 @@ IMPORTANT: Do not include any internal thinking or drafting process. Provide onl
     
     print("🧠 Sending request to Perplexity AI...", file=sys.stderr)
     try:
-        response = requests.post(api_url, headers=headers, json=data)
+        # Passing a generator makes requests send the body with chunked transfer encoding
+        response = requests.post(api_url, headers=headers, data=stream_json_body(data))
         
         print(f"Response status code: {response.status_code}", file=sys.stderr)
         